@@ -6,6 +6,7 @@ import timeit
 
 import humanize
 
+from pkg.fileio import chunk_ops
 from pkg.fileio.async_file_chunker import AsyncFileChunker
 
 
@@ -28,6 +29,26 @@ async def validate_file_path(file_path):
         raise ValueError(f"'{file_path}' is not a file")
 
 
+def positive_int(value):
+    """
+    Parses a command-line value as a positive integer, for use as an argparse
+    `type`.
+
+    :param value: The raw command-line value.
+    :type value: str
+    :raises argparse.ArgumentTypeError: If the value is not an integer of at least 1
+    :return: The parsed integer.
+    :rtype: int
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 ################################################################################
 #                             M  A  I  N  L  I  N  E                           #
 ################################################################################
@@ -47,16 +68,47 @@ async def main():
     """
     parser = argparse.ArgumentParser(description="CHUNKER: File processing in BYTES!")
     parser.add_argument("file_path", type=pathlib.Path, help="The file to process")
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=AsyncFileChunker.DEFAULT_CHUNK_SIZE,
+        help="Size of each chunk in bytes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--op",
+        choices=sorted(chunk_ops.CHUNK_OPS),
+        help="Checksum each chunk and report the chunk count and a value combining the "
+        "per-chunk checksums in file order (default: none)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help="Copy the file to this path in the kernel instead of processing its chunks",
+    )
     args = parser.parse_args()
+    if args.op is not None and args.output is not None:
+        parser.error("--op cannot be combined with -o/--output")
 
     try:
         await validate_file_path(args.file_path)
-        processor = AsyncFileChunker()
-
-        start_time = timeit.default_timer()
-        await processor.process_file(args.file_path)
-        end_time = timeit.default_timer()
+        # The chunk operations run in native code that releases the GIL, so
+        # threads parallelize them without copying chunks to worker processes.
+        async with AsyncFileChunker(
+            chunk_size=args.chunk_size,
+            process_fn=chunk_ops.CHUNK_OPS.get(args.op),
+            use_processes=False,
+        ) as processor:
+            results = None
+            start_time = timeit.default_timer()
+            if args.output is None:
+                results = await processor.process_file(args.file_path)
+            else:
+                await processor.process_file_to(args.file_path, args.output)
+            end_time = timeit.default_timer()
 
+        if args.op is not None and results is not None:
+            print(f"{args.op.upper()}: {len(results):,} chunks, combined {chunk_ops.combine(args.op, results)}")
         print(f"Elapsed: {humanize.scientific(round((end_time - start_time) * 1e6, 3))} µs")
     except (FileNotFoundError, ValueError) as e:
         print(f"Error: {e}")
@@ -1,67 +1,75 @@
-import multiprocessing
+import sys
+import threading
+
+# Free-threaded CPython builds run bytecode in parallel, so an in-place integer
+# addition is no longer atomic there.
+_GIL_DISABLED = not getattr(sys, "_is_gil_enabled", lambda: True)()
 
 
 class AtomicCounter:
     """
-    A thread-safe atomic counter.
+    A lightweight in-process atomic counter.
 
-    This class provides a thread-safe counter implementation that supports
-    increment and decrement operations. It ensures atomicity using a
-    multiprocessing Lock, making it a suitable choice for scenarios requiring
-    thread-safe counter updates, such as multi-threaded or multi-process
-    environments.
+    This class provides a counter implementation that supports increment and
+    decrement operations. On CPython builds with a GIL every update is a single
+    in-place integer addition, which the GIL already executes atomically, so no
+    synchronization primitive is used. On free-threaded builds updates are
+    guarded by a `threading.Lock`, an uncontended futex rather than the kernel
+    semaphore a multiprocessing Lock would require.
 
-    :ivar value: A shared multiprocessing value storing the counter's current
-        value.
-    :type value: multiprocessing.Value
-    :ivar lock: A multiprocessing lock utilized to synchronize access and
-        maintain thread-safety for the counter operations.
-    :type lock: multiprocessing.Lock
+    :ivar _value: The counter's current value.
+    :type _value: int
+    :ivar _lock: Lock guarding updates on free-threaded builds, otherwise None.
+    :type _lock: threading.Lock | None
     """
+    __slots__ = ("_value", "_lock")
 
     def __init__(self, initial=0):
-        self.value = multiprocessing.Value('i', initial)
-        self.lock = multiprocessing.Lock()
+        self._value = initial
+        self._lock = threading.Lock() if _GIL_DISABLED else None
 
     def increment(self, num=1):
         """
-        Increments the shared value by the specified amount in a thread-safe
-        manner using a lock.
+        Increments the counter by the specified amount.
 
-        Locks ensure that the increment operation is performed atomically when
-        accessing the shared value, preventing potential data corruption in
-        multi-threaded scenarios. The method increments the shared integer
-        value by the amount defined by the `num` parameter.
+        The update is a single integer addition, which only takes a lock on
+        free-threaded builds.
 
-        :param num: The amount to add to the shared value. Defaults to 1.
+        :param num: The amount to add to the counter. Defaults to 1.
         :type num: int
         :return: None
         """
-        with self.lock:
-            self.value.value += num
+        if self._lock is None:
+            self._value += num
+        else:
+            with self._lock:
+                self._value += num
 
     def decrement(self, num=1):
         """
-        Decrements the shared value by a specified amount in a thread-safe manner.
+        Decrements the counter by a specified amount.
 
-        This method uses a threading lock to ensure that the shared
-        value is decremented safely across multiple threads. The decrement
-        amount defaults to 1 if not provided explicitly by the user.
+        The update is a single integer subtraction, which only takes a lock on
+        free-threaded builds. The decrement amount defaults to 1 if not
+        provided explicitly by the user.
 
-        :param num: The amount by which the shared value will be
-            decreased. Defaults to 1.
+        :param num: The amount by which the counter will be decreased.
+            Defaults to 1.
         :return: None
         """
-        with self.lock:
-            self.value.value -= num
+        if self._lock is None:
+            self._value -= num
+        else:
+            with self._lock:
+                self._value -= num
 
     def get(self):
         """
-        Retrieves the current value stored in the `value` attribute, ensuring thread-safe
-        access by using a lock.
+        Retrieves the current value of the counter.
+
+        Reading a single attribute is atomic on every build, so no lock is taken.
 
-        :return: The current value stored in the `value` attribute.
-        :rtype: Any
+        :return: The current value of the counter.
+        :rtype: int
         """
-        with self.lock:
-            return self.value.value
+        return self._value
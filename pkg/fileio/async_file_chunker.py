@@ -1,9 +1,11 @@
 import asyncio
-
-import aiofiles
-import humanize
+import concurrent.futures
+import functools
+import os
+import sys
 
 from pkg.atomics import atomic_counter
+from pkg.fileio import pread_backend, uring_backend
 
 
 class AsyncFileChunker:
@@ -15,40 +17,154 @@ class AsyncFileChunker:
     and total bytes read. It is suitable for handling large files that might not
     fit into memory by processing them in smaller, consistent chunks.
 
+    Chunks are handled by a pool of concurrent workers, so up to `pipeline_depth`
+    reads and chunk operations are in flight at any time and chunks may complete
+    out of file order.
+
+    Chunk processing runs on a worker pool that is created on first use, by default
+    a process pool so CPU-bound processing is not serialized by the GIL. Use the
+    chunker as an async context manager, or call `close`, to shut the pool down.
+
     :ivar chunk_counter: Counter to track the number of processed chunks.
     :type chunk_counter: atomic_counter.AtomicCounter
     :ivar total_bytes: Counter to track the total number of processed bytes.
     :type total_bytes: atomic_counter.AtomicCounter
+    :ivar chunk_size: Default size of each chunk read from a file, in bytes.
+    :type chunk_size: int
+    :ivar pipeline_depth: Number of concurrent workers reading and processing chunks.
+    :type pipeline_depth: int
+    :ivar process_fn: Optional function called with each chunk; None skips processing.
+        Chunks alias reusable read buffers and must not be retained after it returns.
+    :type process_fn: Callable[[bytes | memoryview], Any] | None
+    :ivar use_processes: Whether `process_fn` runs in worker processes rather than
+        worker threads. Worker processes require a picklable `process_fn` and receive
+        each chunk as a bytes copy.
+    :type use_processes: bool
+    :ivar max_workers: Maximum number of pool workers; None uses the executor default.
+    :type max_workers: int | None
+    :ivar initializer: Optional callable run once in each pool worker at startup,
+        for example to preload constants used by `process_fn`.
+    :type initializer: Callable[..., Any] | None
+    :ivar initargs: Arguments passed to `initializer`.
+    :type initargs: tuple
     """
-    DEFAULT_CHUNK_SIZE = 8192
-    PROCESS_DELAY_SECONDS = 0.1
+    DEFAULT_CHUNK_SIZE = 1 << 20
+    DEFAULT_PIPELINE_DEPTH = 32
+    REPORT_INTERVAL_BYTES = 1 << 20
+    LOG_FLUSH_INTERVAL_SECONDS = 0.1
+    PROGRESS_FORMAT = "Processed[{:>6,}]:{:>10,}B / {:>14,}B\n"
 
-    def __init__(self):
+    def __init__(
+        self,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        pipeline_depth=DEFAULT_PIPELINE_DEPTH,
+        process_fn=None,
+        use_processes=True,
+        max_workers=None,
+        initializer=None,
+        initargs=(),
+    ):
         self.chunk_counter = atomic_counter.AtomicCounter()
         self.total_bytes = atomic_counter.AtomicCounter()
+        self.chunk_size = self._check_chunk_size(chunk_size)
+        self.pipeline_depth = pipeline_depth
+        self.process_fn = process_fn
+        self.use_processes = use_processes
+        self.max_workers = max_workers
+        self.initializer = initializer
+        self.initargs = initargs
+        self._pool = None
+        self._buffers = []
+        self._last_report_bytes = 0
+        self._log_queue = None
+        self._log_task = None
+
+    async def __aenter__(self):
+        self._log_queue = asyncio.Queue()
+        self._log_task = asyncio.create_task(self._log_consumer())
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self._log_task.cancel()
+        try:
+            await self._log_task
+        except asyncio.CancelledError:
+            pass
+        self._log_task = None
+        self._write_progress_reports(self._log_queue)
+        self._log_queue = None
+        await asyncio.to_thread(self.close)
+
+    def close(self):
+        """
+        Shuts down the chunk processing pool, waiting for running work to finish,
+        and releases the read buffers. Both are recreated if the chunker is used
+        again. Safe to call more than once.
+
+        :return: None
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._buffers = []
 
-    async def process_file(self, file_path, chunk_size=DEFAULT_CHUNK_SIZE):
+    async def process_file(self, file_path, chunk_size=None):
         """
         Asynchronously processes a file by reading its content in chunks and performing
         custom operations on each chunk. Updates internal metrics based on the size
         of the chunks processed.
 
+        The file is split into chunk offsets up front, and up to `pipeline_depth`
+        workers each repeatedly claim the next offset, read it into the worker's own
+        buffer, and process it. Reads go through io_uring when it is available and
+        through positional reads on the default executor otherwise. The read buffers
+        are checked out of a pool for the duration of the call and returned to it
+        afterwards, so processing many files allocates them only once while
+        concurrent calls still read into separate buffers. If a chunk fails, the
+        call waits for reads and processing already running on an executor
+        before it returns the buffers.
+
         :param file_path: Full path to the file to be processed.
         :type file_path: str
-        :param chunk_size: Size of each chunk to read from the file in bytes. Defaults
-            to DEFAULT_CHUNK_SIZE.
-        :type chunk_size: int
-        :return: None
-        :rtype: None
+        :param chunk_size: Size of each chunk to read from the file in bytes, rounded
+            up to a multiple of the file system block size. Defaults to the
+            instance's `chunk_size`.
+        :type chunk_size: int | None
+        :return: The results of `process_fn` for every chunk, in file order, or None
+            if there is no processing function or processing failed.
+        :rtype: list | None
+        :raises ValueError: If `chunk_size` is less than 1.
         :raises FileNotFoundError: If the specified file does not exist.
         :raises PermissionError: If the file cannot be accessed due to permission issues.
         :raises Exception: For any other errors encountered during file processing.
         """
+        chunk_size = self.chunk_size if chunk_size is None else self._check_chunk_size(chunk_size)
         try:
-            async with aiofiles.open(file_path, 'rb') as file:
-                while chunk := await file.read(chunk_size):
-                    await self._process_single_chunk(chunk)
-                    self._update_metrics(len(chunk))
+            chunk_size = self._align_chunk_size(file_path, chunk_size)
+            chunk_offsets = range(0, os.stat(file_path).st_size, chunk_size)
+            buffers = self._acquire_buffers(chunk_size, max(1, min(self.pipeline_depth, len(chunk_offsets))))
+            results = {}
+            jobs = set()
+            try:
+                reader_type = uring_backend.UringFileReader if uring_backend.is_available() else pread_backend.PreadFileReader
+                async with reader_type(file_path, buffers) as reader:
+                    offsets = self._advise_offsets(reader.fileno(), chunk_offsets, reader.depth * chunk_size, jobs)
+                    try:
+                        await self._run_workers(
+                            self._chunk_worker(functools.partial(reader.read, index), offsets, results, jobs)
+                            for index in range(reader.depth)
+                        )
+                    finally:
+                        # Cancelled workers leave already running jobs behind, and
+                        # those may still be using the buffers or the file.
+                        if jobs:
+                            await asyncio.wait(jobs)
+            finally:
+                self._release_buffers(buffers)
+            if self.total_bytes.get() > self._last_report_bytes:
+                self._display_progress()
+            if self.process_fn is not None:
+                return [results[offset] for offset in sorted(results)]
         except FileNotFoundError:
             print(f"File not found: {file_path}")
         except PermissionError:
@@ -56,25 +172,297 @@ class AsyncFileChunker:
         except Exception as e:
             print(f"Error processing file: {str(e)}")
 
-    async def _process_single_chunk(self, chunk):
+    async def process_file_to(self, src_path, dst_path, chunk_size=None):
         """
-        Processes a single chunk with a specified delay.
+        Asynchronously copies a file to a destination in chunks, updating the same
+        metrics as `process_file`.
 
-        This asynchronous method processes a single given chunk and introduces a
-        delay determined by the `PROCESS_DELAY_SECONDS` attribute before continuing.
+        Use this instead of `process_file` when processing a chunk amounts to writing
+        it elsewhere. Each chunk is transferred with `os.sendfile`, which copies the
+        data entirely inside the kernel, so it never passes through a user-space
+        buffer. Copying between regular files with `os.sendfile` requires Linux.
 
-        :param chunk: The chunk to be processed.
-        :type chunk: Any
+        :param src_path: Full path to the file to be copied.
+        :type src_path: str
+        :param dst_path: Full path to the destination file, which is created or
+            truncated.
+        :type dst_path: str
+        :param chunk_size: Maximum number of bytes to transfer per call, rounded up
+            to a multiple of the file system block size. Defaults to the instance's
+            `chunk_size`.
+        :type chunk_size: int | None
         :return: None
         :rtype: None
+        :raises ValueError: If `chunk_size` is less than 1, or if the source and
+            destination are the same file.
+        :raises FileNotFoundError: If the source file or the destination directory does not exist.
+        :raises PermissionError: If either file cannot be accessed due to permission issues.
+        :raises Exception: For any other errors encountered during the copy.
+        """
+        chunk_size = self.chunk_size if chunk_size is None else self._check_chunk_size(chunk_size)
+        # Opening the destination truncates it, which would destroy the source. A
+        # missing source is left to the error handling below.
+        if os.path.exists(src_path) and os.path.exists(dst_path) and os.path.samefile(src_path, dst_path):
+            raise ValueError(f"'{src_path}' and '{dst_path}' are the same file")
+        try:
+            chunk_size = self._align_chunk_size(src_path, chunk_size)
+            loop = asyncio.get_running_loop()
+            src_fd = os.open(src_path, os.O_RDONLY)
+            try:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(src_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    run_in_executor = loop.run_in_executor
+                    sendfile = os.sendfile
+                    update_metrics = self._update_metrics
+                    offset = 0
+                    while sent := await run_in_executor(None, sendfile, dst_fd, src_fd, offset, chunk_size):
+                        offset += sent
+                        update_metrics(sent)
+                finally:
+                    os.close(dst_fd)
+            finally:
+                os.close(src_fd)
+            if self.total_bytes.get() > self._last_report_bytes:
+                self._display_progress()
+        except FileNotFoundError as e:
+            print(f"File not found: {e.filename}")
+        except PermissionError as e:
+            print(f"Permission denied accessing file: {e.filename}")
+        except Exception as e:
+            print(f"Error copying file: {str(e)}")
+
+    @staticmethod
+    def _advise_offsets(fd, chunk_offsets, window, jobs):
+        """
+        Yields chunk offsets in order while hinting the kernel's page cache about
+        the sequential access pattern.
+
+        The file is marked as sequential up front, which enlarges readahead. Each
+        time the offsets cross into a new window, the following window is prefetched
+        with `POSIX_FADV_WILLNEED`, and cached pages from before the previous window,
+        which no read still in flight can need, are dropped with
+        `POSIX_FADV_DONTNEED` to keep the page cache small. Only pages not dropped
+        by an earlier window are advised. Both hints can block while the kernel
+        starts readahead, so they run on the default executor rather than the event
+        loop. The offsets are yielded unchanged where `os.posix_fadvise` is
+        unavailable.
+
+        :param fd: The file descriptor being read.
+        :type fd: int
+        :param chunk_offsets: The chunk offsets, in increasing order.
+        :type chunk_offsets: range
+        :param window: Size of the advice window in bytes; at least the span of
+            reads that can be in flight at once.
+        :type window: int
+        :param jobs: Set each advice job is tracked in until it finishes, so the
+            caller can wait for them before closing `fd`.
+        :type jobs: set[asyncio.Future]
+        :return: Iterator over the chunk offsets.
+        :rtype: Iterator[int]
+        """
+        if not hasattr(os, "posix_fadvise"):
+            yield from chunk_offsets
+            return
+
+        def advise(prefetch_offset, drop_offset, drop_length):
+            # The hints are advisory, so a failure must not fail the read.
+            try:
+                os.posix_fadvise(fd, prefetch_offset, window, os.POSIX_FADV_WILLNEED)
+                if drop_length:
+                    os.posix_fadvise(fd, drop_offset, drop_length, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+
+        loop = asyncio.get_running_loop()
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        next_window = 0
+        dropped_end = 0
+        for offset in chunk_offsets:
+            if offset >= next_window:
+                next_window = offset + window
+                drop_end = max(dropped_end, offset - window)
+                job = loop.run_in_executor(None, advise, next_window, dropped_end, drop_end - dropped_end)
+                jobs.add(job)
+                job.add_done_callback(jobs.discard)
+                dropped_end = drop_end
+            yield offset
+
+    def _acquire_buffers(self, chunk_size, count):
         """
-        await asyncio.sleep(self.PROCESS_DELAY_SECONDS)
+        Checks `count` read buffers out of the chunker's buffer pool, allocating
+        any the pool cannot supply.
+
+        Checked-out buffers belong to a single call until they are returned with
+        `_release_buffers`, so concurrent `process_file` calls never read into the
+        same memory. Buffers are only allocated when first needed, so small files
+        never pay for zero-filling a full pipeline's worth of buffers.
+
+        :param chunk_size: Size of each buffer in bytes.
+        :type chunk_size: int
+        :param count: Number of buffers needed.
+        :type count: int
+        :return: The read buffers.
+        :rtype: list[bytearray]
+        """
+        if self._buffers and len(self._buffers[0]) != chunk_size:
+            self._buffers = []
+        split = max(0, len(self._buffers) - count)
+        buffers = self._buffers[split:]
+        del self._buffers[split:]
+        buffers.extend(bytearray(chunk_size) for _ in range(count - len(buffers)))
+        return buffers
+
+    def _release_buffers(self, buffers):
+        """
+        Returns read buffers to the chunker's buffer pool for reuse by later calls.
+        The pool keeps at most `pipeline_depth` buffers, all of the same size.
+
+        :param buffers: Buffers previously checked out with `_acquire_buffers`.
+        :type buffers: list[bytearray]
+        :return: None
+        """
+        if self._buffers and len(self._buffers[0]) != len(buffers[0]):
+            self._buffers = []
+        self._buffers.extend(buffers[:self.pipeline_depth - len(self._buffers)])
+
+    @staticmethod
+    def _check_chunk_size(chunk_size):
+        """
+        Validates a chunk size.
+
+        :param chunk_size: The chunk size in bytes.
+        :type chunk_size: int
+        :return: The chunk size, unchanged.
+        :rtype: int
+        :raises ValueError: If the chunk size is less than 1.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be at least 1 byte, got {chunk_size}")
+        return chunk_size
+
+    @staticmethod
+    def _align_chunk_size(file_path, chunk_size):
+        """
+        Rounds a chunk size up to a multiple of the block size of the file system
+        holding the file, so every read covers whole blocks. The chunk size is
+        returned unchanged where `os.statvfs` is unavailable.
+
+        :param file_path: Full path to the file to be processed.
+        :type file_path: str
+        :param chunk_size: The requested chunk size in bytes.
+        :type chunk_size: int
+        :return: The aligned chunk size in bytes.
+        :rtype: int
+        """
+        if not hasattr(os, "statvfs"):
+            return chunk_size
+        block_size = os.statvfs(file_path).f_bsize or 1
+        return -(-chunk_size // block_size) * block_size
+
+    @staticmethod
+    async def _run_workers(workers):
+        """
+        Runs worker coroutines concurrently until all of them finish. If any
+        worker fails, the remaining workers are cancelled before the error is
+        propagated.
+
+        :param workers: The worker coroutines to run.
+        :type workers: Iterable[Coroutine]
+        :return: None
+        :raises Exception: The first error raised by a worker.
+        """
+        tasks = [asyncio.ensure_future(worker) for worker in workers]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _chunk_worker(self, read, offsets, results, jobs):
+        """
+        Repeatedly claims the next unread chunk offset, reads the chunk, and
+        processes it, until every offset has been claimed or the file ends early.
+
+        The offsets iterator is shared by all workers, so each chunk is read by
+        exactly one of them. Metrics are updated as soon as a chunk completes. The
+        bound methods used per chunk are looked up once, before the loop.
+
+        :param read: Callable taking a file offset and returning an awaitable that
+            resolves to the chunk read at that offset.
+        :type read: Callable[[int], Awaitable[memoryview]]
+        :param offsets: Shared iterator over the chunk offsets still to be read.
+        :type offsets: Iterator[int]
+        :param results: Shared mapping the processing result of each chunk is stored
+            in, keyed by chunk offset.
+        :type results: dict[int, Any]
+        :param jobs: Shared set of the executor jobs currently running for the call.
+        :type jobs: set[asyncio.Future]
+        :return: None
+        """
+        process_single_chunk = self._process_single_chunk
+        update_metrics = self._update_metrics
+        for offset in offsets:
+            chunk = await read(offset)
+            if not chunk:
+                break
+            results[offset] = await process_single_chunk(chunk, jobs)
+            update_metrics(len(chunk))
+
+    async def _process_single_chunk(self, chunk, jobs):
+        """
+        Processes a single chunk with the configured processing function.
+
+        The processing function runs on the chunker's worker pool, so chunks handled
+        by different pipeline workers are processed in parallel and the event loop
+        keeps servicing reads. Without a processing function this is a no-op.
+
+        :param chunk: The chunk to be processed.
+        :type chunk: bytes | memoryview
+        :param jobs: Set the processing job is tracked in until it finishes, even
+            if the caller is cancelled first.
+        :type jobs: set[asyncio.Future]
+        :return: The result of the processing function, or None without one.
+        :rtype: Any
+        """
+        if self.process_fn is None:
+            return None
+        if self.use_processes:
+            # Memoryviews cannot be pickled; the copy is what gets sent to the worker.
+            chunk = bytes(chunk)
+        future = asyncio.get_running_loop().run_in_executor(self._get_pool(), self.process_fn, chunk)
+        jobs.add(future)
+        future.add_done_callback(jobs.discard)
+        return await asyncio.shield(future)
+
+    def _get_pool(self):
+        """
+        Returns the chunk processing pool, creating it on first use.
+
+        :return: The pool `process_fn` is run on.
+        :rtype: concurrent.futures.Executor
+        """
+        if self._pool is None:
+            if self.use_processes:
+                executor_type = concurrent.futures.ProcessPoolExecutor
+            else:
+                executor_type = concurrent.futures.ThreadPoolExecutor
+            self._pool = executor_type(
+                max_workers=self.max_workers,
+                initializer=self.initializer,
+                initargs=self.initargs,
+            )
+        return self._pool
 
     def _update_metrics(self, chunk_length):
         """
         Updates the internal metrics for tracking data processing. This method increments
-        the total byte count, updates the chunk counter, and displays processing progress
-        based on the current chunk length.
+        the total byte count and updates the chunk counter. Progress is only displayed
+        once at least REPORT_INTERVAL_BYTES have been processed since the last report,
+        keeping output formatting and stdout writes off the per-chunk path.
 
         :param chunk_length: Length of the data chunk that has been processed
         :type chunk_length: int
@@ -82,20 +470,58 @@ class AsyncFileChunker:
         """
         self.total_bytes.increment(chunk_length)
         self.chunk_counter.increment()
-        self._display_progress(chunk_length)
+        if self.total_bytes.get() - self._last_report_bytes >= self.REPORT_INTERVAL_BYTES:
+            self._display_progress()
 
-    def _display_progress(self, chunk_length):
+    def _display_progress(self):
         """
         Displays the progress of data processing in a formatted output. This method
-        prints the processed chunks and total bytes processed using a human-readable
-        format for better visibility.
+        reports the processed chunks, the bytes processed since the previous report, and
+        the total bytes processed with thousands separators for better visibility.
 
-        :param chunk_length: The length of the current chunk being processed.
-        :type chunk_length: int
+        Inside the chunker's async context the report is handed to the log consumer
+        task, which formats and writes it off the chunk path. Otherwise it is written
+        immediately.
+
+        :return: None
+        """
+        total_bytes = self.total_bytes.get()
+        report = (self.chunk_counter.get(), total_bytes - self._last_report_bytes, total_bytes)
+        self._last_report_bytes = total_bytes
+        if self._log_queue is not None:
+            self._log_queue.put_nowait(report)
+        else:
+            sys.stdout.write(self.PROGRESS_FORMAT.format(*report))
+
+    async def _log_consumer(self):
+        """
+        Writes queued progress reports to stdout until cancelled.
+
+        After each write the consumer waits `LOG_FLUSH_INTERVAL_SECONDS`, so all
+        reports queued in the meantime are written together with a single
+        `sys.stdout.write`.
+
+        :return: None
+        """
+        queue = self._log_queue
+        while True:
+            self._write_progress_reports(queue, [await queue.get()])
+            await asyncio.sleep(self.LOG_FLUSH_INTERVAL_SECONDS)
+
+    def _write_progress_reports(self, queue, reports=()):
+        """
+        Formats the given reports followed by every report currently in the queue,
+        and writes them with a single `sys.stdout.write`.
+
+        :param queue: The queue of pending progress reports.
+        :type queue: asyncio.Queue
+        :param reports: Reports already taken from the queue.
+        :type reports: Iterable[tuple[int, int, int]]
         :return: None
         """
-        print(
-            f"Processed[{humanize.intcomma(self.chunk_counter.get()):>4}]:"
-            f"{humanize.intcomma(chunk_length):>6}B / "
-            f"{humanize.intcomma(self.total_bytes.get()):>10}B"
-        )
+        progress_format = self.PROGRESS_FORMAT.format
+        lines = [progress_format(*report) for report in reports]
+        while not queue.empty():
+            lines.append(progress_format(*queue.get_nowait()))
+        if lines:
+            sys.stdout.write("".join(lines))
@@ -0,0 +1,60 @@
+import hashlib
+import zlib
+
+
+def crc32(chunk):
+    """
+    Computes the CRC-32 checksum of a chunk.
+
+    `zlib.crc32` runs in native code using the CPU's carry-less multiply
+    instructions where available, and releases the GIL for large buffers, so
+    it can run on a thread pool in parallel with reads.
+
+    :param chunk: The chunk to checksum.
+    :type chunk: bytes | memoryview
+    :return: The unsigned CRC-32 checksum of the chunk.
+    :rtype: int
+    """
+    return zlib.crc32(chunk)
+
+
+def sha256(chunk):
+    """
+    Computes the SHA-256 digest of a chunk.
+
+    `hashlib` uses OpenSSL, which takes advantage of the CPU's SHA extensions
+    where available, and releases the GIL for large buffers, so it can run on
+    a thread pool in parallel with reads.
+
+    :param chunk: The chunk to hash.
+    :type chunk: bytes | memoryview
+    :return: The SHA-256 digest of the chunk.
+    :rtype: bytes
+    """
+    return hashlib.sha256(chunk).digest()
+
+
+def combine(op_name, results):
+    """
+    Combines the per-chunk results of a chunk operation into a single value.
+
+    The per-chunk results are serialized in file order and passed through the
+    same algorithm again, so the combined value identifies the file's content
+    for a given chunk size. It is not the checksum of the whole file.
+
+    :param op_name: The name of the chunk operation, a key of `CHUNK_OPS`.
+    :type op_name: str
+    :param results: The operation's result for every chunk, in file order.
+    :type results: list[int] | list[bytes]
+    :return: The combined value as a hexadecimal string.
+    :rtype: str
+    """
+    if op_name == "crc32":
+        return f"{zlib.crc32(b''.join(result.to_bytes(4, 'big') for result in results)):08x}"
+    return hashlib.sha256(b"".join(results)).hexdigest()
+
+
+CHUNK_OPS = {
+    "crc32": crc32,
+    "sha256": sha256,
+}
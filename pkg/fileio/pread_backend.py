@@ -0,0 +1,135 @@
+import asyncio
+import os
+import threading
+
+# Windows has neither os.pread nor os.preadv.
+_HAS_PREADV = hasattr(os, "preadv")
+
+
+class PreadFileReader:
+    """
+    Reads a file with positional reads on the default executor.
+
+    This class is the portable counterpart of `UringFileReader` and exposes the
+    same interface. Each read runs `os.preadv` on the event loop's default
+    executor and fills one of a fixed set of caller-owned buffers in place, so
+    reading a chunk never allocates a new bytes object. On platforms without
+    `os.preadv`, such as Windows, each read instead seeks and calls `readinto`
+    on an unbuffered file object under a lock, so reads still fill the buffers
+    in place but run one at a time.
+
+    Each buffer slot can have at most one read in flight. The memoryview a
+    read resolves to aliases its slot, so it is only valid until the next read
+    is submitted for that slot. Cancelling a read does not stop a positional
+    read that is already running on the executor, so leaving the async context
+    waits for such reads before the file is closed.
+
+    :ivar file_path: Path of the file being read.
+    :type file_path: str
+    :ivar chunk_size: Size of each buffer, and the maximum size of each read.
+    :type chunk_size: int
+    :ivar depth: Number of buffer slots, and the maximum number of reads in
+        flight.
+    :type depth: int
+    :ivar buffers: The equally sized buffers reads are made into, one per
+        slot. They are owned by the caller and can be reused across readers.
+    :type buffers: list[bytearray]
+    """
+
+    def __init__(self, file_path, buffers):
+        self.file_path = file_path
+        self.chunk_size = len(buffers[0])
+        self.depth = len(buffers)
+        self.buffers = buffers
+        self._views = [memoryview(buffer) for buffer in self.buffers]
+        self._fd = -1
+        self._file = None
+        self._file_lock = threading.Lock()
+        self._loop = None
+        self._in_flight = set()
+
+    async def __aenter__(self):
+        self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        try:
+            if self._in_flight:
+                await asyncio.wait(self._in_flight)
+        finally:
+            self.close()
+
+    def open(self):
+        """
+        Opens the file for reading.
+
+        :return: None
+        :raises FileNotFoundError: If the specified file does not exist.
+        :raises PermissionError: If the file cannot be accessed due to permission issues.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._fd = os.open(self.file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        if not _HAS_PREADV:
+            self._file = open(self._fd, "rb", buffering=0, closefd=False)
+
+    def fileno(self):
+        """
+        Returns the file descriptor of the open file.
+
+        :return: The file descriptor, or -1 if the file is not open.
+        :rtype: int
+        """
+        return self._fd
+
+    def close(self):
+        """
+        Closes the file descriptor. Safe to call more than once. Reads still
+        running on the executor must have finished first.
+
+        :return: None
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    async def read(self, index, offset):
+        """
+        Reads up to `chunk_size` bytes at `offset` into buffer slot `index`.
+
+        :param index: The buffer slot to read into.
+        :type index: int
+        :param offset: The file offset to read from.
+        :type offset: int
+        :return: A memoryview over the bytes read, which is empty at end of file.
+        :rtype: memoryview
+        """
+        if _HAS_PREADV:
+            future = self._loop.run_in_executor(None, os.preadv, self._fd, [self.buffers[index]], offset)
+        else:
+            future = self._loop.run_in_executor(None, self._seek_read_into, self.buffers[index], offset)
+        self._in_flight.add(future)
+        future.add_done_callback(self._in_flight.discard)
+        # Shielded so that cancelling the caller leaves the future tracking the
+        # running read, rather than marking it done while the read continues.
+        length = await asyncio.shield(future)
+        return self._views[index][:length]
+
+    def _seek_read_into(self, buffer, offset):
+        """
+        Reads into `buffer` at `offset` by seeking the shared file object, for
+        platforms without positional reads. The lock keeps each seek and read
+        together when several executor threads read at once.
+
+        :param buffer: The buffer to read into.
+        :type buffer: bytearray
+        :param offset: The file offset to read from.
+        :type offset: int
+        :return: The number of bytes read, which is 0 at end of file.
+        :rtype: int
+        """
+        with self._file_lock:
+            self._file.seek(offset)
+            return self._file.readinto(buffer)
@@ -0,0 +1,218 @@
+import asyncio
+import functools
+import os
+
+try:
+    import liburing
+except ImportError:  # Non-Linux platform or liburing is not installed.
+    liburing = None
+
+
+@functools.cache
+def is_available():
+    """
+    Reports whether the io_uring backend can be used on this platform.
+
+    Importing liburing is not enough: io_uring can still be refused at runtime,
+    for example by a container's seccomp profile or the
+    `kernel.io_uring_disabled` sysctl. The first call therefore sets up and
+    tears down a minimal ring, and the result is cached for later calls.
+
+    :return: True if liburing could be imported and a ring could be created,
+        otherwise False.
+    :rtype: bool
+    """
+    if liburing is None:
+        return False
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(1, ring)
+    except OSError:
+        return False
+    liburing.io_uring_queue_exit(ring)
+    return True
+
+
+class UringFileReader:
+    """
+    Reads a file through io_uring with completions delivered to asyncio.
+
+    This class opens a file, registers it together with a set of
+    caller-owned buffers with the kernel, and submits fixed-buffer reads at
+    caller-supplied offsets. Submissions made during the same event loop
+    iteration are batched into a single `io_uring_submit` call, and
+    completions are signaled through an eventfd watched by the event loop, so
+    no read ever goes through a thread pool.
+
+    Each buffer slot can have at most one read in flight. The memoryview a
+    read resolves to aliases its slot, so it is only valid until the next read
+    is submitted for that slot.
+
+    :ivar file_path: Path of the file being read.
+    :type file_path: str
+    :ivar chunk_size: Size of each buffer, and the maximum size of each read.
+    :type chunk_size: int
+    :ivar depth: Number of buffer slots, and the maximum number of reads in
+        flight.
+    :type depth: int
+    :ivar buffers: The equally sized buffers registered with the ring, one
+        per slot. They are owned by the caller and can be reused across readers.
+    :type buffers: list[bytearray]
+    """
+
+    def __init__(self, file_path, buffers):
+        if liburing is None:
+            raise RuntimeError("io_uring backend requires the 'liburing' package")
+        self.file_path = file_path
+        self.chunk_size = len(buffers[0])
+        self.depth = len(buffers)
+        self.buffers = buffers
+        self._views = [memoryview(buffer) for buffer in self.buffers]
+        self._iovecs = None
+        self._files = None
+        self._ring = None
+        self._cqe = None
+        self._fd = -1
+        self._event_fd = -1
+        self._loop = None
+        self._pending = {}
+        self._submit_scheduled = False
+
+    async def __aenter__(self):
+        self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        """
+        Opens the file and sets up the ring, registered resources, and the
+        eventfd used to wake the event loop on completions.
+
+        :return: None
+        :raises FileNotFoundError: If the specified file does not exist.
+        :raises PermissionError: If the file cannot be accessed due to permission issues.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._fd = os.open(self.file_path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            ring = liburing.Ring()
+            liburing.io_uring_queue_init(self.depth, ring)
+            self._ring = ring
+            self._cqe = liburing.Cqe()
+            self._files = liburing.FileIndex([self._fd])
+            liburing.io_uring_register_files(self._ring, self._files)
+            self._iovecs = liburing.Iovec(self.buffers)
+            liburing.io_uring_register_buffers(self._ring, self._iovecs)
+            self._event_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+            liburing.io_uring_register_eventfd(self._ring, self._event_fd)
+            self._loop.add_reader(self._event_fd, self._reap_completions)
+        except BaseException:
+            self.close()
+            raise
+
+    def fileno(self):
+        """
+        Returns the file descriptor of the open file.
+
+        :return: The file descriptor, or -1 if the file is not open.
+        :rtype: int
+        """
+        return self._fd
+
+    def close(self):
+        """
+        Cancels outstanding reads and releases the ring, the eventfd, and the
+        file descriptor. Safe to call more than once.
+
+        :return: None
+        """
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._event_fd >= 0:
+            self._loop.remove_reader(self._event_fd)
+        if self._ring is not None:
+            # Tearing the ring down waits for in-flight reads, after which the
+            # buffers are no longer referenced by the kernel.
+            liburing.io_uring_queue_exit(self._ring)
+            self._ring = None
+        if self._event_fd >= 0:
+            os.close(self._event_fd)
+            self._event_fd = -1
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def read(self, index, offset):
+        """
+        Queues a read of up to `chunk_size` bytes at `offset` into buffer slot
+        `index`.
+
+        :param index: The buffer slot to read into.
+        :type index: int
+        :param offset: The file offset to read from.
+        :type offset: int
+        :return: A future resolving to a memoryview over the bytes read, which
+            is empty at end of file.
+        :rtype: asyncio.Future
+        """
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_read_fixed(sqe, 0, self.buffers[index], index, offset)
+        liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_FIXED_FILE)
+        liburing.io_uring_sqe_set_data64(sqe, index)
+
+        future = self._loop.create_future()
+        self._pending[index] = future
+        if not self._submit_scheduled:
+            self._submit_scheduled = True
+            self._loop.call_soon(self._submit)
+        return future
+
+    def _submit(self):
+        """
+        Submits every read queued since the last submission in one system call.
+
+        :return: None
+        """
+        self._submit_scheduled = False
+        if self._ring is not None:
+            liburing.io_uring_submit(self._ring)
+
+    def _reap_completions(self):
+        """
+        Drains the completion queue and resolves the matching futures. Called
+        by the event loop whenever the eventfd becomes readable.
+
+        :return: None
+        """
+        try:
+            os.eventfd_read(self._event_fd)
+        except BlockingIOError:
+            pass
+
+        # Entries are consumed one at a time: the completion queue is a ring, and
+        # indexing past the first peeked entry would not wrap at its end.
+        while True:
+            try:
+                liburing.io_uring_peek_cqe(self._ring, self._cqe)
+            except BlockingIOError:
+                break
+            entry = self._cqe[0]
+            index = entry.user_data
+            # Reading `res` of a failed read raises the matching OSError, which
+            # must not escape before the entry is marked as seen.
+            try:
+                result, error = entry.res, None
+            except OSError as e:
+                result, error = None, e
+            liburing.io_uring_cqe_seen(self._ring, entry)
+            future = self._pending.pop(index, None)
+            if future is None or future.done():
+                continue
+            if error is not None:
+                error.filename = self.file_path
+                future.set_exception(error)
+            else:
+                future.set_result(self._views[index][:result])
@@ -0,0 +1,159 @@
+import asyncio
+import hashlib
+import itertools
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from pkg.fileio import pread_backend, uring_backend
+from pkg.fileio.async_file_chunker import AsyncFileChunker
+
+
+class ProcessFileTest(unittest.IsolatedAsyncioTestCase):
+    CHUNK_SIZE = 4096
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        stdout = mock.patch("sys.stdout")
+        stdout.start()
+        self.addCleanup(stdout.stop)
+
+    def _write_file(self, name, size):
+        path = os.path.join(self.directory, name)
+        with open(path, "wb") as file:
+            file.write(os.urandom(size))
+        return path
+
+    def _chunk_digests(self, *paths):
+        digests = []
+        for path in paths:
+            with open(path, "rb") as file:
+                while chunk := file.read(self.CHUNK_SIZE):
+                    digests.append(hashlib.sha256(chunk).digest())
+        return sorted(digests)
+
+    async def test_concurrent_calls_do_not_share_buffers(self):
+        paths = [self._write_file(f"{i}.bin", 200 * self.CHUNK_SIZE + i) for i in range(2)]
+        for uring in {uring_backend.is_available(), False}:
+            with self.subTest(uring=uring), mock.patch.object(uring_backend, "is_available", return_value=uring):
+                digests = []
+                process_fn = lambda chunk: digests.append(hashlib.sha256(chunk).digest())
+                async with AsyncFileChunker(chunk_size=self.CHUNK_SIZE, process_fn=process_fn, use_processes=False) as chunker:
+                    await asyncio.gather(*(chunker.process_file(path) for path in paths))
+                    await chunker.process_file(paths[0])
+                self.assertEqual(sorted(digests), self._chunk_digests(*paths, paths[0]))
+
+    async def test_failed_call_waits_for_running_jobs(self):
+        path = self._write_file("file.bin", 8 * self.CHUNK_SIZE)
+        for uring in {uring_backend.is_available(), False}:
+            with self.subTest(uring=uring), mock.patch.object(uring_backend, "is_available", return_value=uring):
+                calls = itertools.count()
+                started, finished = [], []
+
+                def process_fn(chunk):
+                    if next(calls) == 0:
+                        time.sleep(0.05)
+                        raise RuntimeError("processing failed")
+                    started.append(chunk)
+                    time.sleep(0.2)
+                    finished.append(chunk)
+
+                chunker = AsyncFileChunker(chunk_size=self.CHUNK_SIZE, pipeline_depth=8, process_fn=process_fn, use_processes=False)
+                await chunker.process_file(path)
+                self.assertTrue(started)
+                self.assertEqual(len(finished), len(started))
+                chunker.close()
+
+    @unittest.skipUnless(hasattr(os, "posix_fadvise"), "posix_fadvise is not available")
+    async def test_advises_page_cache_off_the_event_loop(self):
+        path = self._write_file("file.bin", 100 * self.CHUNK_SIZE)
+        posix_fadvise = os.posix_fadvise
+        calls = []
+
+        def record_fadvise(fd, offset, length, advice):
+            calls.append((threading.current_thread(), offset, length, advice))
+            posix_fadvise(fd, offset, length, advice)
+
+        with mock.patch("os.posix_fadvise", record_fadvise):
+            async with AsyncFileChunker(chunk_size=self.CHUNK_SIZE, pipeline_depth=4, use_processes=False) as chunker:
+                await chunker.process_file(path)
+
+        hints = [call for call in calls if call[3] != os.POSIX_FADV_SEQUENTIAL]
+        self.assertTrue(hints)
+        self.assertNotIn(threading.current_thread(), [call[0] for call in hints])
+        dropped = [(offset, length) for _, offset, length, advice in hints if advice == os.POSIX_FADV_DONTNEED]
+        self.assertTrue(dropped)
+        self.assertEqual([offset for offset, _ in dropped], [0] + [offset + length for offset, length in dropped[:-1]])
+
+    async def test_reads_without_positional_reads(self):
+        path = self._write_file("file.bin", 300 * self.CHUNK_SIZE + 17)
+        with mock.patch.object(uring_backend, "is_available", return_value=False), \
+                mock.patch.object(pread_backend, "_HAS_PREADV", False):
+            async with AsyncFileChunker(chunk_size=self.CHUNK_SIZE, process_fn=bytes, use_processes=False) as chunker:
+                results = await chunker.process_file(path)
+        with open(path, "rb") as file:
+            self.assertEqual(b"".join(results), file.read())
+
+    async def test_returns_results_in_file_order(self):
+        path = self._write_file("file.bin", 300 * self.CHUNK_SIZE + 17)
+        async with AsyncFileChunker(chunk_size=self.CHUNK_SIZE, process_fn=bytes, use_processes=False) as chunker:
+            results = await chunker.process_file(path)
+        with open(path, "rb") as file:
+            self.assertEqual(b"".join(results), file.read())
+
+    async def test_rejects_non_positive_chunk_sizes(self):
+        path = self._write_file("file.bin", 100)
+        for chunk_size in (0, -5):
+            with self.subTest(chunk_size=chunk_size):
+                with self.assertRaises(ValueError):
+                    AsyncFileChunker(chunk_size=chunk_size)
+                with self.assertRaises(ValueError):
+                    await AsyncFileChunker().process_file(path, chunk_size)
+
+
+class ProcessFileToTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.data = os.urandom(10_000)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.src_path = os.path.join(directory.name, "src.bin")
+        self.dst_path = os.path.join(directory.name, "dst.bin")
+        with open(self.src_path, "wb") as file:
+            file.write(self.data)
+        stdout = mock.patch("sys.stdout")
+        stdout.start()
+        self.addCleanup(stdout.stop)
+
+    async def test_copies_file(self):
+        async with AsyncFileChunker(chunk_size=4096) as chunker:
+            await chunker.process_file_to(self.src_path, self.dst_path)
+        with open(self.dst_path, "rb") as file:
+            self.assertEqual(file.read(), self.data)
+        self.assertEqual(chunker.total_bytes.get(), len(self.data))
+
+    async def test_rejects_copy_onto_itself(self):
+        os.link(self.src_path, self.dst_path)
+        async with AsyncFileChunker() as chunker:
+            for dst_path in (self.src_path, self.dst_path):
+                with self.assertRaises(ValueError):
+                    await chunker.process_file_to(self.src_path, dst_path)
+        with open(self.src_path, "rb") as file:
+            self.assertEqual(file.read(), self.data)
+
+    async def test_reports_missing_source(self):
+        with open(self.dst_path, "wb"):
+            pass
+        missing_path = self.src_path + ".missing"
+        with mock.patch("builtins.print") as print_:
+            await AsyncFileChunker().process_file_to(missing_path, self.dst_path)
+        print_.assert_called_once_with(f"File not found: {missing_path}")
+
+
+if __name__ == "__main__":
+    unittest.main()
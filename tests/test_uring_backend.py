@@ -0,0 +1,91 @@
+import asyncio
+import itertools
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from pkg.fileio import uring_backend
+from pkg.fileio.async_file_chunker import AsyncFileChunker
+
+
+@unittest.skipUnless(uring_backend.is_available(), "io_uring is not available")
+class UringFileReaderTest(unittest.IsolatedAsyncioTestCase):
+    CHUNK_SIZE = 4096
+    CHUNK_COUNT = 3001
+
+    def setUp(self):
+        self.data = os.urandom(self.CHUNK_SIZE * self.CHUNK_COUNT - 123)
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(self.data)
+        self.file_path = file.name
+        self.addCleanup(os.remove, self.file_path)
+
+    async def _read_all(self, depth):
+        chunks = {}
+        offsets = iter(range(0, len(self.data), self.CHUNK_SIZE))
+        # Uneven yields make completions arrive in batches of varying size, so
+        # batches regularly straddle the end of the completion queue.
+        pauses = itertools.cycle([0, 1, 3, 0, 2])
+
+        async def worker(reader, index):
+            for offset in offsets:
+                chunk = await asyncio.wait_for(reader.read(index, offset), timeout=5)
+                chunks[offset] = bytes(chunk)
+                for _ in range(next(pauses)):
+                    await asyncio.sleep(0)
+
+        buffers = [bytearray(self.CHUNK_SIZE) for _ in range(depth)]
+        async with uring_backend.UringFileReader(self.file_path, buffers) as reader:
+            await asyncio.gather(*(worker(reader, index) for index in range(depth)))
+        return chunks
+
+    async def test_reads_every_chunk_at_non_power_of_two_depth(self):
+        for depth in (3, 7, 32):
+            with self.subTest(depth=depth):
+                chunks = await self._read_all(depth)
+                self.assertEqual(len(chunks), self.CHUNK_COUNT)
+                self.assertEqual(b"".join(chunks[offset] for offset in sorted(chunks)), self.data)
+
+    async def test_failed_read_raises(self):
+        buffers = [bytearray(self.CHUNK_SIZE)]
+        with tempfile.TemporaryDirectory() as directory:
+            async with uring_backend.UringFileReader(directory, buffers) as reader:
+                with self.assertRaises(IsADirectoryError):
+                    await asyncio.wait_for(reader.read(0, 0), timeout=5)
+
+
+@unittest.skipIf(uring_backend.liburing is None, "liburing is not installed")
+class UringAvailabilityTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        uring_backend.is_available.cache_clear()
+        self.addCleanup(uring_backend.is_available.cache_clear)
+        patcher = mock.patch.object(
+            uring_backend.liburing,
+            "io_uring_queue_init",
+            side_effect=PermissionError(1, "Operation not permitted"),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unavailable_when_ring_setup_is_refused(self):
+        self.assertFalse(uring_backend.is_available())
+
+    async def test_chunker_falls_back_when_ring_setup_is_refused(self):
+        data = os.urandom(10_000)
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(data)
+        self.addCleanup(os.remove, file.name)
+
+        chunks = []
+        chunker = AsyncFileChunker(chunk_size=4096, process_fn=chunks.append, use_processes=False)
+        with mock.patch("sys.stdout"):
+            await chunker.process_file(file.name)
+            chunker.close()
+        self.assertEqual(chunker.total_bytes.get(), len(data))
+        self.assertEqual(chunker.chunk_counter.get(), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()